@@ -13,6 +13,7 @@ import numpy as np
 import pandas as pd
 
 from edisgo.flex_opt.charging_strategies import charging_strategy
+from edisgo.flex_opt.check_tech_constraints import clear_load_feedin_case_cache
 from edisgo.flex_opt.heat_pump_operation import (
     operating_strategy as hp_operating_strategy,
 )
@@ -871,6 +872,9 @@ class EDisGo:
 
         # handle converged time steps
         pypsa_io.process_pfa_results(self, pypsa_network, timesteps_converged)
+        # load or feed-in case of time steps may have changed since the last power
+        # flow
+        clear_load_feedin_case_cache(self)
 
         return timesteps_not_converged
 
@@ -1,6 +1,9 @@
 import itertools
 import logging
+import os
+import weakref
 
+from concurrent.futures import ThreadPoolExecutor
 from math import sqrt
 
 import numpy as np
@@ -10,6 +13,109 @@ from edisgo.network.grids import LVGrid, MVGrid
 
 logger = logging.getLogger(__name__)
 
+# cache for load or feed-in case of power flow time steps per EDisGo object, see
+# :func:`clear_load_feedin_case_cache`
+_load_feedin_case_cache = weakref.WeakKeyDictionary()
+
+
+def clear_load_feedin_case_cache(edisgo_obj=None):
+    """
+    Clears cached load or feed-in case of power flow time steps.
+
+    Determining whether a time step is a load or feed-in case requires the residual
+    load of the whole grid. As it is needed in several checks, it is cached and the
+    cache is cleared whenever a new power flow analysis is conducted
+    (see :attr:`~.edisgo.EDisGo.analyze`).
+
+    Parameters
+    ----------
+    edisgo_obj : :class:`~.EDisGo` or None
+        EDisGo object to clear cache for. If None, cache of all EDisGo objects is
+        cleared. Default: None.
+
+    """
+    if edisgo_obj is None:
+        _load_feedin_case_cache.clear()
+    else:
+        _load_feedin_case_cache.pop(edisgo_obj, None)
+
+
+def _map_lv_grids(edisgo_obj, func):
+    """
+    Applies given function to all LV grids.
+
+    The number of threads used is set through parameter `n_jobs_lv_grids` in
+    section 'grid_expansion_parallelization' of the config file
+    'config_grid_expansion'. If it is not set, LV grids are handled one after
+    another.
+
+    Parameters
+    ----------
+    edisgo_obj : :class:`~.EDisGo`
+    func : callable
+        Function that takes an :class:`~.network.grids.LVGrid` object as only
+        parameter.
+
+    Returns
+    -------
+    list
+        List with return values of `func` for all LV grids, in the same order as
+        :attr:`~.network.topology.Topology.lv_grids`.
+
+    """
+    lv_grids = list(edisgo_obj.topology.lv_grids)
+    try:
+        n_jobs = int(
+            edisgo_obj.config["grid_expansion_parallelization"]["n_jobs_lv_grids"]
+        )
+    except KeyError:
+        n_jobs = 1
+    if n_jobs < 0:
+        n_jobs = os.cpu_count() or 1
+    n_jobs = min(n_jobs, len(lv_grids))
+
+    if n_jobs <= 1:
+        return [func(lv_grid) for lv_grid in lv_grids]
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        return list(executor.map(func, lv_grids))
+
+
+def _loc_array(df, index=None, columns=None):
+    """
+    Returns values of given rows and columns of a dataframe as array.
+
+    Rows and columns are looked up positionally through
+    :pandas:`pandas.Index.get_indexer<Index.get_indexer>`, which avoids the
+    overhead of label based selection through `.loc` on large dataframes.
+
+    Parameters
+    ----------
+    df : :pandas:`pandas.DataFrame<DataFrame>`
+    index : list-like or None
+        Row labels to select. If None, all rows are selected. Default: None.
+    columns : list-like or None
+        Column labels to select. If None, all columns are selected. Default: None.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array with values of selected rows and columns.
+
+    """
+    values = df.to_numpy()
+    for axis, (labels, df_labels) in enumerate(
+        [(index, df.index), (columns, df.columns)]
+    ):
+        if labels is None:
+            continue
+        positions = df_labels.get_indexer(labels)
+        if (positions < 0).any():
+            raise KeyError(
+                "{} not in dataframe.".format(list(pd.Index(labels)[positions < 0]))
+            )
+        values = values.take(positions, axis=axis)
+    return values
+
 
 def mv_line_load(edisgo_obj):
     """
@@ -97,6 +203,37 @@ def lv_line_load(edisgo_obj):
     return crit_lines
 
 
+def _timesteps_load_feedin_case(edisgo_obj):
+    """
+    Returns load or feed-in case of all time steps of the last power flow analysis.
+
+    The result is cached until the next power flow analysis, see
+    :func:`clear_load_feedin_case_cache`. The cache key includes the time steps
+    of the last power flow analysis, so that results for different time steps are
+    not mixed up.
+
+    Parameters
+    ----------
+    edisgo_obj : :class:`~.EDisGo`
+
+    Returns
+    -------
+    :pandas:`pandas.Series<Series>`
+        Series with 'load_case' or 'feed-in_case' per time step. Index of the series
+        are all time steps power flow analysis was conducted for. See
+        :attr:`~.network.timeseries.TimeSeries.timesteps_load_feedin_case` for more
+        information. The returned series is the cached object and must not be
+        modified.
+
+    """
+    timeindex = edisgo_obj.results.i_res.index
+    key = (len(timeindex),) + tuple(timeindex[:1]) + tuple(timeindex[-1:])
+    cache = _load_feedin_case_cache.setdefault(edisgo_obj, {})
+    if key not in cache:
+        cache[key] = edisgo_obj.timeseries.timesteps_load_feedin_case.loc[timeindex]
+    return cache[key]
+
+
 def lines_allowed_load(edisgo_obj, voltage_level):
     """
     Get allowed maximum current per line per time step
@@ -120,12 +257,16 @@ def lines_allowed_load(edisgo_obj, voltage_level):
     # get lines and nominal voltage
     mv_grid = edisgo_obj.topology.mv_grid
     if voltage_level == "lv":
-        lines_df = edisgo_obj.topology.lines_df[
-            ~edisgo_obj.topology.lines_df.index.isin(mv_grid.lines_df.index)
+        lines_df = edisgo_obj.topology.lines_df.loc[
+            edisgo_obj.topology.lines_df.index.difference(
+                mv_grid.lines_df.index, sort=False
+            )
         ]
-        lv_grids = list(edisgo_obj.topology.lv_grids)
-        if len(lv_grids) > 0:
-            nominal_voltage = lv_grids[0].nominal_voltage
+        # only the first LV grid is needed to get the nominal voltage, wherefore
+        # not all LV grids are created
+        lv_grid = next(edisgo_obj.topology.lv_grids, None)
+        if lv_grid is not None:
+            nominal_voltage = lv_grid.nominal_voltage
         else:
             nominal_voltage = np.NaN
     elif voltage_level == "mv":
@@ -138,52 +279,54 @@ def lines_allowed_load(edisgo_obj, voltage_level):
             "'lv'.".format(voltage_level)
         )
 
-    i_lines_allowed_per_case = {}
-    i_lines_allowed_per_case["feed-in_case"] = (
-        lines_df.s_nom
-        / sqrt(3)
-        / nominal_voltage
-        * edisgo_obj.config["grid_expansion_load_factors"][
-            "{}_feed-in_case_line".format(voltage_level)
-        ]
-    )
+    load_factors = edisgo_obj.config["grid_expansion_load_factors"]
+    i_lines_allowed = lines_df.s_nom.to_numpy() / sqrt(3) / nominal_voltage
 
-    # adapt i_lines_allowed for radial feeders
-    buses_in_cycles = list(
-        set(itertools.chain.from_iterable(edisgo_obj.topology.rings))
-    )
+    # multiplication with load factors is skipped in case they are one
+    load_factor = load_factors["{}_feed-in_case_line".format(voltage_level)]
+    if load_factor != 1.0:
+        i_lines_allowed_feedin_case = i_lines_allowed * load_factor
+    else:
+        i_lines_allowed_feedin_case = i_lines_allowed
 
-    # Find lines in cycles
-    lines_in_cycles = list(
-        lines_df.loc[
-            lines_df[["bus0", "bus1"]].isin(buses_in_cycles).all(axis=1)
-        ].index.values
-    )
-    lines_radial_feeders = list(
-        lines_df.loc[~lines_df.index.isin(lines_in_cycles)].index.values
-    )
+    load_factor = load_factors["{}_load_case_line".format(voltage_level)]
+    if load_factor != 1.0:
+        # adapt i_lines_allowed for radial feeders
+        buses_in_cycles = pd.Index(
+            set(itertools.chain.from_iterable(edisgo_obj.topology.rings))
+        )
 
-    # lines in cycles have to be n-1 secure
-    i_lines_allowed_per_case["load_case"] = (
-        lines_df.loc[lines_in_cycles].s_nom
-        / sqrt(3)
-        / nominal_voltage
-        * edisgo_obj.config["grid_expansion_load_factors"][
-            "{}_load_case_line".format(voltage_level)
-        ]
-    )
+        # find lines in cycles by looking up both buses of all lines at once
+        lines_in_cycles = (
+            buses_in_cycles.get_indexer(lines_df[["bus0", "bus1"]].to_numpy().ravel())
+            .reshape(-1, 2)
+            .min(axis=1)
+            >= 0
+        )
 
-    # lines in radial feeders are not n-1 secure anyways
-    i_lines_allowed_per_case["load_case"] = pd.concat(
-        [
-            i_lines_allowed_per_case["load_case"],
-            lines_df.loc[lines_radial_feeders].s_nom / sqrt(3) / nominal_voltage,
-        ]
-    )
+        # lines in cycles have to be n-1 secure, lines in radial feeders are not
+        # n-1 secure anyways
+        i_lines_allowed_load_case = i_lines_allowed.copy()
+        i_lines_allowed_load_case[lines_in_cycles] *= load_factor
+    else:
+        i_lines_allowed_load_case = i_lines_allowed
 
-    i_lines_allowed = edisgo_obj.timeseries.timesteps_load_feedin_case.loc[
-        edisgo_obj.results.i_res.index
-    ].apply(lambda _: i_lines_allowed_per_case[_])
+    # look up allowed line load per time step by indexing an array with one row
+    # per case with the case codes of all time steps
+    cases = ["feed-in_case", "load_case"]
+    i_lines_allowed_arr = np.stack(
+        [i_lines_allowed_feedin_case, i_lines_allowed_load_case]
+    )
+    case_codes = (
+        _timesteps_load_feedin_case(edisgo_obj)
+        .map({case: code for code, case in enumerate(cases)})
+        .to_numpy()
+    )
+    i_lines_allowed = pd.DataFrame(
+        i_lines_allowed_arr[case_codes],
+        index=edisgo_obj.results.i_res.index,
+        columns=lines_df.index,
+    )
     return i_lines_allowed
 
 
@@ -204,15 +347,27 @@ def lines_relative_load(edisgo_obj, lines_allowed_load):
     :pandas:`pandas.DataFrame<DataFrame>`
         Dataframe containing the relative line load per line and time step.
         Index and columns of the dataframe are the same as those of parameter
-        `lines_allowed_load`.
+        `lines_allowed_load`. The data type is the one of the power flow
+        results, i.e. in case memory of the results was reduced (see
+        :attr:`~.network.results.Results.reduce_memory`) relative line load is
+        calculated in reduced precision as well.
 
     """
     # get line load from power flow analysis
-    i_lines_pfa = edisgo_obj.results.i_res.loc[
-        lines_allowed_load.index, lines_allowed_load.columns
-    ]
+    i_lines_pfa = _loc_array(
+        edisgo_obj.results.i_res, lines_allowed_load.index, lines_allowed_load.columns
+    )
+    if np.issubdtype(i_lines_pfa.dtype, np.floating):
+        dtype = i_lines_pfa.dtype
+    else:
+        dtype = None
 
-    return i_lines_pfa / lines_allowed_load
+    # divide underlying arrays, as both are aligned
+    return pd.DataFrame(
+        np.divide(i_lines_pfa, lines_allowed_load.to_numpy(dtype=dtype)),
+        index=lines_allowed_load.index,
+        columns=lines_allowed_load.columns,
+    )
 
 
 def _line_load(edisgo_obj, voltage_level):
@@ -252,17 +407,26 @@ def _line_load(edisgo_obj, voltage_level):
     # calculate relative line load and keep maximum over-load of each line
     relative_i_res = lines_relative_load(edisgo_obj, i_lines_allowed)
 
-    crit_lines_relative_load = relative_i_res[relative_i_res > 1].max().dropna()
-    if len(crit_lines_relative_load) > 0:
-        crit_lines = pd.concat(
-            [
-                crit_lines_relative_load,
-                relative_i_res.idxmax()[crit_lines_relative_load.index],
-            ],
-            axis=1,
-            keys=["max_rel_overload", "time_index"],
-            sort=True,
-        )
+    # get maximum relative line load and corresponding time step of each line in
+    # one pass over the underlying array (NaN values are ignored)
+    rel_load = relative_i_res.to_numpy()
+    if rel_load.size > 0:
+        if np.isnan(rel_load).any():
+            rel_load = np.nan_to_num(rel_load, nan=-np.inf)
+        idx_max = rel_load.argmax(axis=0)
+        max_rel_load = rel_load[idx_max, np.arange(rel_load.shape[1])]
+        overloaded = max_rel_load > 1
+    else:
+        overloaded = np.zeros(0, dtype=bool)
+
+    if overloaded.any():
+        crit_lines = pd.DataFrame(
+            {
+                "max_rel_overload": max_rel_load[overloaded],
+                "time_index": relative_i_res.index[idx_max[overloaded]],
+            },
+            index=relative_i_res.columns[overloaded],
+        ).sort_index()
         crit_lines.loc[:, "voltage_level"] = voltage_level
     else:
         crit_lines = pd.DataFrame(dtype=float)
@@ -332,14 +496,12 @@ def mv_lv_station_load(edisgo_obj):
 
     """
 
-    crit_stations = pd.DataFrame(dtype=float)
-    for lv_grid in edisgo_obj.topology.lv_grids:
-        crit_stations = pd.concat(
-            [
-                crit_stations,
-                _station_load(edisgo_obj, lv_grid),
-            ]
-        )
+    crit_stations = _map_lv_grids(
+        edisgo_obj, lambda lv_grid: _station_load(edisgo_obj, lv_grid)
+    )
+    crit_stations = (
+        pd.concat(crit_stations) if crit_stations else pd.DataFrame(dtype=float)
+    )
     if not crit_stations.empty:
         logger.debug(
             "==> {} MV/LV station(s) has/have load issues.".format(
@@ -377,9 +539,12 @@ def _station_load(edisgo_obj, grid):
     if isinstance(grid, LVGrid):
         voltage_level = "lv"
         transformers_df = grid.transformers_df
-        s_station_pfa = edisgo_obj.results.s_res.loc[:, transformers_df.index].sum(
-            axis=1
-        )
+        # apparent power is only calculated for the station's transformers instead
+        # of using Results.s_res, which is calculated for all components
+        pfa_p = edisgo_obj.results.pfa_p
+        p = _loc_array(pfa_p, columns=transformers_df.index)
+        q = _loc_array(edisgo_obj.results.pfa_q, columns=transformers_df.index)
+        s_station_pfa = pd.Series(np.hypot(p, q).sum(axis=1), index=pfa_p.index)
     elif isinstance(grid, MVGrid):
         voltage_level = "mv"
         transformers_df = edisgo_obj.topology.transformers_hvmv_df
@@ -390,36 +555,36 @@ def _station_load(edisgo_obj, grid):
                 "MV was not included in power flow analysis, wherefore load "
                 "of HV/MV station cannot be calculated."
             )
-        s_station_pfa = np.hypot(
-            edisgo_obj.results.pfa_slack.p,
-            edisgo_obj.results.pfa_slack.q,
+        p = edisgo_obj.results.pfa_slack.p.to_numpy()
+        q = edisgo_obj.results.pfa_slack.q.to_numpy()
+        s_station_pfa = pd.Series(
+            np.sqrt(p * p + q * q), index=edisgo_obj.results.pfa_slack.index
         )
     else:
         raise ValueError("Inserted grid is invalid.")
 
     # get maximum allowed apparent power of station in each time step
-    s_station = sum(transformers_df.s_nom)
-    load_factor = edisgo_obj.timeseries.timesteps_load_feedin_case.apply(
-        lambda _: edisgo_obj.config["grid_expansion_load_factors"][
-            f"{voltage_level}_{_}_transformer"
-        ]
-    )
-
-    s_station_allowed = s_station * load_factor
+    load_factor = _station_load_factor(edisgo_obj, voltage_level)
+    s_station_allowed = _station_allowed_load(edisgo_obj, transformers_df, load_factor)
 
     # calculate residual apparent power (if negative, station is over-loaded)
-    s_res = s_station_allowed - s_station_pfa
-    s_res = s_res[s_res < 0]
+    timeindex = s_station_pfa.index
+    s_res = s_station_allowed.reindex(timeindex).to_numpy() - s_station_pfa.to_numpy()
+    overloaded = s_res < 0
 
-    if not s_res.empty:
+    if overloaded.any():
         # calculate greatest apparent power missing (residual apparent power is
         # devided by the load factor to account for load factors smaller than
         # one, which lead to a higher needed additional capacity)
-        s_missing = (s_res / load_factor).dropna()
+        s_missing = np.full(len(s_res), np.inf)
+        s_missing[overloaded] = (
+            s_res[overloaded] / load_factor.reindex(timeindex).to_numpy()[overloaded]
+        )
+        idx_min = s_missing.argmin()
         return pd.DataFrame(
             {
-                "s_missing": abs(s_missing.min()),
-                "time_index": s_missing.idxmin(),
+                "s_missing": abs(s_missing[idx_min]),
+                "time_index": timeindex[idx_min],
             },
             index=[repr(grid)],
         )
@@ -428,6 +593,60 @@ def _station_load(edisgo_obj, grid):
         return pd.DataFrame(dtype=float)
 
 
+def _station_load_factor(edisgo_obj, voltage_level):
+    """
+    Returns load factor of station transformers in each time step.
+
+    Parameters
+    ----------
+    edisgo_obj : :class:`~.EDisGo`
+    voltage_level : str
+        Voltage level of the station's secondary side. Possible options are
+        "mv" or "lv".
+
+    Returns
+    -------
+    :pandas:`pandas.Series<Series>`
+        Series with load factor per time step. Index of the series are all time
+        steps power flow analysis was conducted for.
+
+    """
+    return _timesteps_load_feedin_case(edisgo_obj).map(
+        {
+            case: edisgo_obj.config["grid_expansion_load_factors"][
+                f"{voltage_level}_{case}_transformer"
+            ]
+            for case in ["feed-in_case", "load_case"]
+        }
+    )
+
+
+def _station_allowed_load(edisgo_obj, transformers_df, load_factor):
+    """
+    Calculates allowed apparent power of station in each time step.
+
+    Parameters
+    ----------
+    edisgo_obj : :class:`~.EDisGo`
+    transformers_df : :pandas:`pandas.DataFrame<DataFrame>`
+        Dataframe with transformers of the station.
+    load_factor : :pandas:`pandas.Series<Series>`
+        Load factor of station transformers per time step as returned by
+        :func:`_station_load_factor`.
+
+    Returns
+    -------
+    :pandas:`pandas.Series<Series>`
+        Series with allowed apparent power of station in MVA per time step.
+
+    """
+    s_station = transformers_df.s_nom.sum()
+    # skip multiplication in case load factor is one in all time steps
+    if (load_factor == 1.0).all():
+        return pd.Series(s_station, index=load_factor.index)
+    return s_station * load_factor
+
+
 def mv_voltage_deviation(edisgo_obj, voltage_levels="mv_lv"):
     """
     Checks for voltage stability issues in MV network.
@@ -543,8 +762,6 @@ def lv_voltage_deviation(edisgo_obj, mode=None, voltage_levels="mv_lv"):
 
     """
 
-    crit_buses = {}
-
     if voltage_levels == "mv_lv":
         v_limits_upper, v_limits_lower = _mv_allowed_voltage_limits(edisgo_obj, "mv_lv")
     elif not "lv" == voltage_levels:
@@ -554,31 +771,35 @@ def lv_voltage_deviation(edisgo_obj, mode=None, voltage_levels="mv_lv"):
             "'lv'.".format(voltage_levels)
         )
 
-    for lv_grid in edisgo_obj.topology.lv_grids:
-
-        if mode:
-            if mode == "stations":
-                buses = lv_grid.station.index
-            else:
-                raise ValueError(
-                    "{} is not a valid option for input variable 'mode' in "
-                    "function lv_voltage_deviation. Try 'stations' or "
-                    "None.".format(mode)
-                )
+    if mode and mode != "stations":
+        raise ValueError(
+            "{} is not a valid option for input variable 'mode' in "
+            "function lv_voltage_deviation. Try 'stations' or "
+            "None.".format(mode)
+        )
+
+    def _lv_grid_voltage_deviation(lv_grid):
+        if mode == "stations":
+            buses = lv_grid.station.index
         else:
             buses = lv_grid.buses_df.index
 
         if voltage_levels == "lv":
-            v_limits_upper, v_limits_lower = _lv_allowed_voltage_limits(
-                edisgo_obj, lv_grid, mode
-            )
+            v_upper, v_lower = _lv_allowed_voltage_limits(edisgo_obj, lv_grid, mode)
+        else:
+            v_upper, v_lower = v_limits_upper, v_limits_lower
 
-        crit_buses_grid = _voltage_deviation(
-            edisgo_obj, buses, v_limits_upper, v_limits_lower
-        )
+        return str(lv_grid), _voltage_deviation(edisgo_obj, buses, v_upper, v_lower)
 
-        if not crit_buses_grid.empty:
-            crit_buses[str(lv_grid)] = crit_buses_grid
+    # grid representatives are returned along with the voltage issues, so that LV
+    # grids only need to be created once
+    crit_buses = {
+        lv_grid_repr: crit_buses_grid
+        for lv_grid_repr, crit_buses_grid in _map_lv_grids(
+            edisgo_obj, _lv_grid_voltage_deviation
+        )
+        if not crit_buses_grid.empty
+    }
 
     if crit_buses:
         if mode == "stations":
@@ -629,42 +850,31 @@ def _mv_allowed_voltage_limits(edisgo_obj, voltage_levels):
         for of type :pandas:`pandas.Timestamp<Timestamp>`.
 
     """
+    config = edisgo_obj.config["grid_expansion_allowed_voltage_deviations"]
     v_allowed_per_case = {}
 
     # get config values for lower voltage limit in feed-in case and upper
     # voltage limit in load case
-    v_allowed_per_case["feed-in_case_lower"] = edisgo_obj.config[
-        "grid_expansion_allowed_voltage_deviations"
-    ]["feed-in_case_lower"]
-    v_allowed_per_case["load_case_upper"] = edisgo_obj.config[
-        "grid_expansion_allowed_voltage_deviations"
-    ]["load_case_upper"]
+    v_allowed_per_case["feed-in_case_lower"] = config["feed-in_case_lower"]
+    v_allowed_per_case["load_case_upper"] = config["load_case_upper"]
 
     # calculate upper voltage limit in feed-in case and lower voltage limit in
     # load case
-    offset = edisgo_obj.config["grid_expansion_allowed_voltage_deviations"][
-        "hv_mv_trafo_offset"
-    ]
-    control_deviation = edisgo_obj.config["grid_expansion_allowed_voltage_deviations"][
-        "hv_mv_trafo_control_deviation"
-    ]
+    offset = config["hv_mv_trafo_offset"]
+    control_deviation = config["hv_mv_trafo_control_deviation"]
 
     if voltage_levels == "mv_lv" or voltage_levels == "mv":
         v_allowed_per_case["feed-in_case_upper"] = (
             1
             + offset
             + control_deviation
-            + edisgo_obj.config["grid_expansion_allowed_voltage_deviations"][
-                "{}_feed-in_case_max_v_deviation".format(voltage_levels)
-            ]
+            + config["{}_feed-in_case_max_v_deviation".format(voltage_levels)]
         )
         v_allowed_per_case["load_case_lower"] = (
             1
             + offset
             - control_deviation
-            - edisgo_obj.config["grid_expansion_allowed_voltage_deviations"][
-                "{}_load_case_max_v_deviation".format(voltage_levels)
-            ]
+            - config["{}_load_case_max_v_deviation".format(voltage_levels)]
         )
     else:
         raise ValueError(
@@ -672,11 +882,13 @@ def _mv_allowed_voltage_limits(edisgo_obj, voltage_levels):
         )
 
     # create series with upper and lower voltage limits for each time step
-    v_limits_upper = edisgo_obj.timeseries.timesteps_load_feedin_case.apply(
-        lambda _: v_allowed_per_case["{}_upper".format(_)]
+    cases = ["feed-in_case", "load_case"]
+    load_feedin_case = edisgo_obj.timeseries.timesteps_load_feedin_case
+    v_limits_upper = load_feedin_case.map(
+        {case: v_allowed_per_case["{}_upper".format(case)] for case in cases}
     )
-    v_limits_lower = edisgo_obj.timeseries.timesteps_load_feedin_case.apply(
-        lambda _: v_allowed_per_case["{}_lower".format(_)]
+    v_limits_lower = load_feedin_case.map(
+        {case: v_allowed_per_case["{}_lower".format(case)] for case in cases}
     )
 
     return v_limits_upper, v_limits_lower
@@ -711,6 +923,7 @@ def _lv_allowed_voltage_limits(edisgo_obj, lv_grid, mode):
         for of type :pandas:`pandas.Timestamp<Timestamp>`.
 
     """
+    config = edisgo_obj.config["grid_expansion_allowed_voltage_deviations"]
     v_allowed_per_case = {}
 
     # get reference voltages for different modes
@@ -727,42 +940,43 @@ def _lv_allowed_voltage_limits(edisgo_obj, lv_grid, mode):
     # calculate upper voltage limit in feed-in case and lower voltage limit in
     # load case
     v_allowed_per_case["feed-in_case_upper"] = (
-        voltage_base
-        + edisgo_obj.config["grid_expansion_allowed_voltage_deviations"][
-            "{}_feed-in_case_max_v_deviation".format(config_string)
-        ]
+        voltage_base + config["{}_feed-in_case_max_v_deviation".format(config_string)]
     )
     v_allowed_per_case["load_case_lower"] = (
-        voltage_base
-        - edisgo_obj.config["grid_expansion_allowed_voltage_deviations"][
-            "{}_load_case_max_v_deviation".format(config_string)
-        ]
+        voltage_base - config["{}_load_case_max_v_deviation".format(config_string)]
     )
 
     timeindex = voltage_base.index
     v_allowed_per_case["feed-in_case_lower"] = pd.Series(
-        edisgo_obj.config["grid_expansion_allowed_voltage_deviations"][
-            "feed-in_case_lower"
-        ],
+        config["feed-in_case_lower"],
         index=timeindex,
     )
     v_allowed_per_case["load_case_upper"] = pd.Series(
-        edisgo_obj.config["grid_expansion_allowed_voltage_deviations"][
-            "load_case_upper"
-        ],
+        config["load_case_upper"],
         index=timeindex,
     )
 
     # create series with upper and lower voltage limits for each time step
-    v_limits_upper = []
-    v_limits_lower = []
-    load_feedin_case = edisgo_obj.timeseries.timesteps_load_feedin_case
-    for t in timeindex:
-        case = load_feedin_case.loc[t]
-        v_limits_upper.append(v_allowed_per_case["{}_upper".format(case)].loc[t])
-        v_limits_lower.append(v_allowed_per_case["{}_lower".format(case)].loc[t])
-    v_limits_upper = pd.Series(v_limits_upper, index=timeindex)
-    v_limits_lower = pd.Series(v_limits_lower, index=timeindex)
+    feedin_case = (
+        _timesteps_load_feedin_case(edisgo_obj).reindex(timeindex).to_numpy()
+        == "feed-in_case"
+    )
+    v_limits_upper = pd.Series(
+        np.where(
+            feedin_case,
+            v_allowed_per_case["feed-in_case_upper"].to_numpy(),
+            v_allowed_per_case["load_case_upper"].to_numpy(),
+        ),
+        index=timeindex,
+    )
+    v_limits_lower = pd.Series(
+        np.where(
+            feedin_case,
+            v_allowed_per_case["feed-in_case_lower"].to_numpy(),
+            v_allowed_per_case["load_case_lower"].to_numpy(),
+        ),
+        index=timeindex,
+    )
 
     return v_limits_upper, v_limits_lower
 
@@ -812,53 +1026,33 @@ def voltage_diff(edisgo_obj, buses, v_dev_allowed_upper, v_dev_allowed_lower):
     """
     v_mag_pu_pfa = edisgo_obj.results.v_res.loc[:, buses]
 
-    v_dev_allowed_upper_format = np.tile(
-        (v_dev_allowed_upper.loc[v_mag_pu_pfa.index]).values,
-        (v_mag_pu_pfa.shape[1], 1),
-    )
-    v_dev_allowed_lower_format = np.tile(
-        (v_dev_allowed_lower.loc[v_mag_pu_pfa.index]).values,
-        (v_mag_pu_pfa.shape[1], 1),
-    )
-    overvoltage = v_mag_pu_pfa.T[v_mag_pu_pfa.T > v_dev_allowed_upper_format].dropna(
-        how="all"
-    )
-    undervoltage = v_mag_pu_pfa.T[v_mag_pu_pfa.T < v_dev_allowed_lower_format].dropna(
-        how="all"
-    )
+    # align voltage limits with time steps of power flow results once
+    v_upper = v_dev_allowed_upper.reindex(v_mag_pu_pfa.index).to_numpy()
+    v_lower = v_dev_allowed_lower.reindex(v_mag_pu_pfa.index).to_numpy()
+
+    # calculate deviations from allowed upper and lower voltage limits (positive
+    # in case of over- or undervoltage, respectively)
+    v_mag_pu = v_mag_pu_pfa.to_numpy()
+    v_diff_ov = v_mag_pu - v_upper[:, np.newaxis]
+    v_diff_uv = v_lower[:, np.newaxis] - v_mag_pu
+
     # sort buses with under- and overvoltage issues in a way that
-    # worst case is saved
-    buses_both = v_mag_pu_pfa[
-        overvoltage[overvoltage.index.isin(undervoltage.index)].index
-    ]
-    voltage_diff_ov = buses_both.T - v_dev_allowed_upper.loc[v_mag_pu_pfa.index].values
-    voltage_diff_uv = -buses_both.T + v_dev_allowed_lower.loc[v_mag_pu_pfa.index].values
-    voltage_diff_ov = voltage_diff_ov.loc[
-        voltage_diff_ov.max(axis=1) > voltage_diff_uv.max(axis=1)
-    ]
-    voltage_diff_uv = voltage_diff_uv.loc[
-        ~voltage_diff_uv.index.isin(voltage_diff_ov.index)
-    ]
-    # handle buses with overvoltage issues and append to voltage_diff_ov
-    buses_ov = v_mag_pu_pfa[
-        overvoltage[~overvoltage.index.isin(buses_both.columns)].index
-    ]
-    voltage_diff_ov = pd.concat(
-        [
-            voltage_diff_ov,
-            buses_ov.T - v_dev_allowed_upper.loc[v_mag_pu_pfa.index].values,
-        ]
+    # worst case is saved (NaN values are ignored)
+    max_ov = np.fmax.reduce(v_diff_ov, axis=0, initial=-np.inf)
+    max_uv = np.fmax.reduce(v_diff_uv, axis=0, initial=-np.inf)
+    buses_ov = (max_ov > 0) & (max_ov > max_uv)
+    buses_uv = (max_uv > 0) & ~buses_ov
+
+    # only dataframes of buses with voltage issues are created
+    voltage_diff_ov = pd.DataFrame(
+        v_diff_ov[:, buses_ov].T,
+        index=v_mag_pu_pfa.columns[buses_ov],
+        columns=v_mag_pu_pfa.index,
     )
-
-    # handle buses with undervoltage issues and append to voltage_diff_uv
-    buses_uv = v_mag_pu_pfa[
-        undervoltage[~undervoltage.index.isin(buses_both.columns)].index
-    ]
-    voltage_diff_uv = pd.concat(
-        [
-            voltage_diff_uv,
-            -buses_uv.T + v_dev_allowed_lower.loc[v_mag_pu_pfa.index].values,
-        ]
+    voltage_diff_uv = pd.DataFrame(
+        v_diff_uv[:, buses_uv].T,
+        index=v_mag_pu_pfa.columns[buses_uv],
+        columns=v_mag_pu_pfa.index,
     )
 
     return voltage_diff_uv, voltage_diff_ov
@@ -900,40 +1094,34 @@ def _voltage_deviation(edisgo_obj, buses, v_limits_upper, v_limits_lower):
     """
 
     def _append_crit_buses(df):
+        # get maximum voltage deviation and corresponding time step of each bus in
+        # one pass over the underlying array (NaN values are ignored)
+        v_diff = df.to_numpy()
+        if np.isnan(v_diff).any():
+            v_diff = np.nan_to_num(v_diff, nan=-np.inf)
+        idx_max = v_diff.argmax(axis=1)
         return pd.DataFrame(
             {
-                "v_diff_max": df.max(axis=1).values,
-                "time_index": df.idxmax(axis=1).values,
+                "v_diff_max": v_diff[np.arange(v_diff.shape[0]), idx_max],
+                "time_index": df.columns[idx_max],
             },
             index=df.index,
         )
 
-    crit_buses_grid = pd.DataFrame(dtype=float)
-
     voltage_diff_uv, voltage_diff_ov = voltage_diff(
         edisgo_obj, buses, v_limits_upper, v_limits_lower
     )
 
-    # append to crit buses dataframe
-    if not voltage_diff_ov.empty:
-        crit_buses_grid = pd.concat(
-            [
-                crit_buses_grid,
-                _append_crit_buses(voltage_diff_ov),
-            ]
-        )
-    if not voltage_diff_uv.empty:
-        crit_buses_grid = pd.concat(
-            [
-                crit_buses_grid,
-                _append_crit_buses(voltage_diff_uv),
-            ]
-        )
-
-    if not crit_buses_grid.empty:
-        crit_buses_grid.sort_values(by=["v_diff_max"], ascending=False, inplace=True)
+    # concatenate over- and undervoltage issues in one go
+    crit_buses = [
+        _append_crit_buses(df)
+        for df in [voltage_diff_ov, voltage_diff_uv]
+        if not df.empty
+    ]
+    if not crit_buses:
+        return pd.DataFrame(dtype=float)
 
-    return crit_buses_grid
+    return pd.concat(crit_buses).sort_values(by=["v_diff_max"], ascending=False)
 
 
 def check_ten_percent_voltage_deviation(edisgo_obj):
@@ -949,7 +1137,11 @@ def check_ten_percent_voltage_deviation(edisgo_obj):
 
     """
 
-    v_mag_pu_pfa = edisgo_obj.results.v_res
-    if (v_mag_pu_pfa > 1.1).any().any() or (v_mag_pu_pfa < 0.9).any().any():
+    # check minimum and maximum voltage on underlying array instead of comparing
+    # all voltages (NaN values are ignored)
+    v_mag_pu_pfa = edisgo_obj.results.v_res.to_numpy()
+    if v_mag_pu_pfa.size > 0 and (
+        np.nanmax(v_mag_pu_pfa) > 1.1 or np.nanmin(v_mag_pu_pfa) < 0.9
+    ):
         message = "Maximum allowed voltage deviation of 10% exceeded."
         raise ValueError(message)
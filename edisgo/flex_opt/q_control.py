@@ -1,5 +1,4 @@
 import numpy as np
-import pandas as pd
 
 
 def get_q_sign_generator(reactive_power_mode):
@@ -140,13 +139,13 @@ def _fixed_cosphi_default_power_factor(comp_df, component_type, configs):
 
     if component_type in comp_dict.keys():
         comp = comp_dict[component_type]
-        # write series with power factor for each component
-        power_factor = pd.Series(index=comp_df.index, dtype=float)
-        for voltage_level in comp_df.voltage_level.unique():
-            cols = comp_df.index[comp_df.voltage_level == voltage_level]
-            if len(cols) > 0:
-                power_factor[cols] = reactive_power_factor[f"{voltage_level}_{comp}"]
-        return power_factor
+        # write series with power factor for each component by mapping the voltage
+        # level of each component to the power factor of that voltage level
+        power_factors = {
+            voltage_level: reactive_power_factor[f"{voltage_level}_{comp}"]
+            for voltage_level in comp_df.voltage_level.dropna().unique()
+        }
+        return comp_df.voltage_level.map(power_factors).astype(float).rename(None)
     else:
         raise ValueError(
             "Given 'component_type' is not valid. Valid options are "
@@ -195,15 +194,13 @@ def _fixed_cosphi_default_reactive_power_sign(comp_df, component_type, configs):
     if component_type in comp_dict.keys():
         comp = comp_dict[component_type]
         get_q_sign = q_sign_dict[component_type]
-        # write series with power factor for each component
-        q_sign = pd.Series(index=comp_df.index, dtype=float)
-        for voltage_level in comp_df.voltage_level.unique():
-            cols = comp_df.index[comp_df.voltage_level == voltage_level]
-            if len(cols) > 0:
-                q_sign[cols] = get_q_sign(
-                    reactive_power_mode[f"{voltage_level}_{comp}"]
-                )
-        return q_sign
+        # write series with sign of reactive power for each component by mapping the
+        # voltage level of each component to the sign of that voltage level
+        q_signs = {
+            voltage_level: get_q_sign(reactive_power_mode[f"{voltage_level}_{comp}"])
+            for voltage_level in comp_df.voltage_level.dropna().unique()
+        }
+        return comp_df.voltage_level.map(q_signs).astype(float).rename(None)
     else:
         raise ValueError(
             "Given 'component_type' is not valid. Valid options are "
@@ -89,9 +89,7 @@ def add_storage_from_edisgo(edisgo_obj, psa_net, pm_dict):
     storage["status"] = 1
 
     # Get Bus indices from PyPSA net
-    storage["storage_bus"] = [
-        psa_net.buses.index.get_loc(bus) + 1 for bus in storage["storage_bus"]
-    ]
+    storage["storage_bus"] = _get_bus_indices(psa_net, storage["storage_bus"]) + 1
     storage.index = [i + 1 for i in range(len(storage))]
 
     # Add dedicated 'index' column because PowerModels likes it
@@ -179,82 +177,126 @@ def ppc2pm(ppc, psa_net):  # pragma: no cover
         "per_unit": True,
         "name": ppc["name"],
     }
-    load_idx = 1
-    shunt_idx = 1
-    for row in ppc["bus"]:
-        bus = dict()
-        idx = int(row[BUS_I]) + 1  # noqa: F405
-        bus["index"] = idx
-        bus["bus_i"] = idx
-        bus["zone"] = int(row[ZONE])  # noqa: F405
-        bus["bus_type"] = int(row[BUS_TYPE])  # noqa: F405
-        bus["vmax"] = row[VMAX]  # noqa: F405
-        bus["vmin"] = row[VMIN]  # noqa: F405
-        bus["va"] = row[VA]  # noqa: F405
-        bus["vm"] = row[VM]  # noqa: F405
-        bus["base_kv"] = row[BASE_KV]  # noqa: F405
-        pd = row[PD]  # noqa: F405
-        qd = row[QD]  # noqa: F405
-        if pd != 0 or qd != 0:
-            pm["load"][str(load_idx)] = {
-                "pd": pd,
-                "qd": qd,
-                "load_bus": idx,
-                "status": True,
-                "index": load_idx,
-            }
-            load_idx += 1
-        bs = row[BS]  # noqa: F405
-        gs = row[GS]  # noqa: F405
-        if pd != 0 or qd != 0:
-            pm["shunt"][str(shunt_idx)] = {
-                "gs": gs,
-                "bs": bs,
-                "shunt_bus": idx,
-                "status": True,
-                "index": shunt_idx,
-            }
-            shunt_idx += 1
-        pm["bus"][str(idx)] = bus
-
-    n_lines = len(ppc["branch"])
-    for idx, row in enumerate(ppc["branch"], start=1):
-        branch = dict()
-        branch["index"] = idx
-        branch["transformer"] = idx > n_lines
-        branch["br_r"] = row[BR_R].real  # noqa: F405
-        branch["br_x"] = row[BR_X].real  # noqa: F405
-        branch["g_fr"] = -row[BR_B].imag / 2.0  # noqa: F405
-        branch["g_to"] = -row[BR_B].imag / 2.0  # noqa: F405
-        branch["b_fr"] = row[BR_B].real / 2.0  # noqa: F405
-        branch["b_to"] = row[BR_B].real / 2.0  # noqa: F405
-        branch["rate_a"] = (
-            row[RATE_A].real if row[RATE_A] > 0 else row[RATE_B].real  # noqa: F405
+    # extract columns of bus data once and build dictionaries of buses, loads and
+    # shunts from them
+    bus_data = ppc["bus"]
+    bus_idx = (bus_data[:, BUS_I].astype(int) + 1).tolist()  # noqa: F405
+    pm["bus"] = {
+        str(idx): {
+            "index": idx,
+            "bus_i": idx,
+            "zone": zone,
+            "bus_type": bus_type,
+            "vmax": vmax,
+            "vmin": vmin,
+            "va": va,
+            "vm": vm,
+            "base_kv": base_kv,
+        }
+        for idx, zone, bus_type, vmax, vmin, va, vm, base_kv in zip(
+            bus_idx,
+            bus_data[:, ZONE].astype(int).tolist(),  # noqa: F405
+            bus_data[:, BUS_TYPE].astype(int).tolist(),  # noqa: F405
+            bus_data[:, VMAX],  # noqa: F405
+            bus_data[:, VMIN],  # noqa: F405
+            bus_data[:, VA],  # noqa: F405
+            bus_data[:, VM],  # noqa: F405
+            bus_data[:, BASE_KV],  # noqa: F405
         )
-        branch["rate_b"] = row[RATE_B].real  # noqa: F405
-        branch["rate_c"] = row[RATE_C].real  # noqa: F405
-        branch["f_bus"] = int(row[F_BUS].real) + 1  # noqa: F405
-        branch["t_bus"] = int(row[T_BUS].real) + 1  # noqa: F405
-        branch["br_status"] = int(row[BR_STATUS].real)  # noqa: F405
-        branch["angmin"] = row[ANGMIN].real  # noqa: F405
-        branch["angmax"] = row[ANGMAX].real  # noqa: F405
-        branch["tap"] = row[TAP].real  # noqa: F405
-        branch["shift"] = math.radians(row[SHIFT].real)  # noqa: F405
-        pm["branch"][str(idx)] = branch
-
-    for idx, row in enumerate(ppc["gen"], start=1):
-        gen = dict()
-        gen["pg"] = row[PG]  # noqa: F405
-        gen["qg"] = row[QG]  # noqa: F405
-        gen["gen_bus"] = int(row[GEN_BUS]) + 1  # noqa: F405
-        gen["vg"] = row[VG]  # noqa: F405
-        gen["qmax"] = row[QMAX]  # noqa: F405
-        gen["gen_status"] = int(row[GEN_STATUS])  # noqa: F405
-        gen["qmin"] = row[QMIN]  # noqa: F405
-        gen["pmin"] = row[PMIN]  # noqa: F405
-        gen["pmax"] = row[PMAX]  # noqa: F405
-        gen["index"] = idx
-        pm["gen"][str(idx)] = gen
+    }
+    # loads and shunts are only created for buses with demand
+    has_demand = (bus_data[:, PD] != 0) | (bus_data[:, QD] != 0)  # noqa: F405
+    demand_bus_idx = [idx for idx, demand in zip(bus_idx, has_demand) if demand]
+    demand_bus_data = bus_data[has_demand]
+    pm["load"] = {
+        str(load_idx): {
+            "pd": p_d,
+            "qd": q_d,
+            "load_bus": idx,
+            "status": True,
+            "index": load_idx,
+        }
+        for load_idx, (idx, p_d, q_d) in enumerate(
+            zip(
+                demand_bus_idx,
+                demand_bus_data[:, PD],  # noqa: F405
+                demand_bus_data[:, QD],  # noqa: F405
+            ),
+            start=1,
+        )
+    }
+    pm["shunt"] = {
+        str(shunt_idx): {
+            "gs": gs,
+            "bs": bs,
+            "shunt_bus": idx,
+            "status": True,
+            "index": shunt_idx,
+        }
+        for shunt_idx, (idx, gs, bs) in enumerate(
+            zip(
+                demand_bus_idx,
+                demand_bus_data[:, GS],  # noqa: F405
+                demand_bus_data[:, BS],  # noqa: F405
+            ),
+            start=1,
+        )
+    }
+
+    # build branch dictionary from a dataframe with one column per branch attribute
+    # (lines followed by transformers)
+    branch_data = ppc["branch"]
+    n_lines = len(branch_data)
+    branch_idx = np.arange(1, len(branch_data) + 1)
+    g = -branch_data[:, BR_B].imag / 2.0  # noqa: F405
+    b = branch_data[:, BR_B].real / 2.0  # noqa: F405
+    branches = pd.DataFrame(
+        {
+            "index": branch_idx,
+            "transformer": branch_idx > n_lines,
+            "br_r": branch_data[:, BR_R].real,  # noqa: F405
+            "br_x": branch_data[:, BR_X].real,  # noqa: F405
+            "g_fr": g,
+            "g_to": g,
+            "b_fr": b,
+            "b_to": b,
+            "rate_a": np.where(
+                branch_data[:, RATE_A] > 0,  # noqa: F405
+                branch_data[:, RATE_A].real,  # noqa: F405
+                branch_data[:, RATE_B].real,  # noqa: F405
+            ),
+            "rate_b": branch_data[:, RATE_B].real,  # noqa: F405
+            "rate_c": branch_data[:, RATE_C].real,  # noqa: F405
+            "f_bus": branch_data[:, F_BUS].real.astype(int) + 1,  # noqa: F405
+            "t_bus": branch_data[:, T_BUS].real.astype(int) + 1,  # noqa: F405
+            "br_status": branch_data[:, BR_STATUS].real.astype(int),  # noqa: F405
+            "angmin": branch_data[:, ANGMIN].real,  # noqa: F405
+            "angmax": branch_data[:, ANGMAX].real,  # noqa: F405
+            "tap": branch_data[:, TAP].real,  # noqa: F405
+            "shift": np.radians(branch_data[:, SHIFT].real),  # noqa: F405
+        },
+        index=branch_idx.astype(str),
+    )
+    pm["branch"] = branches.to_dict(orient="index")
+
+    gen_data = ppc["gen"]
+    gen_idx = np.arange(1, len(gen_data) + 1)
+    gens = pd.DataFrame(
+        {
+            "pg": gen_data[:, PG],  # noqa: F405
+            "qg": gen_data[:, QG],  # noqa: F405
+            "gen_bus": gen_data[:, GEN_BUS].astype(int) + 1,  # noqa: F405
+            "vg": gen_data[:, VG],  # noqa: F405
+            "qmax": gen_data[:, QMAX],  # noqa: F405
+            "gen_status": gen_data[:, GEN_STATUS].astype(int),  # noqa: F405
+            "qmin": gen_data[:, QMIN],  # noqa: F405
+            "pmin": gen_data[:, PMIN],  # noqa: F405
+            "pmax": gen_data[:, PMAX],  # noqa: F405
+            "index": gen_idx,
+        },
+        index=gen_idx.astype(str),
+    )
+    pm["gen"] = gens.to_dict(orient="index")
 
     # TODO add attribute "fluctuating" to generators from psa_net, maybe move to ppc
     #  first
@@ -264,12 +306,22 @@ def ppc2pm(ppc, psa_net):  # pragma: no cover
     # for idx, row in enumerate(is_fluctuating, start=1):
     #     pm["gen"][str(idx)]["fluctuating"] = row
 
-    for idx, row in enumerate(psa_net.generators["control"], start=1):
-        pm["gen"][str(idx)]["gen_slack"] = (row == "Slack") * 1
-
-    for idx, row in enumerate(psa_net.generators["fluctuating"], start=1):
-        # convert boolean to 0 and 1, check if row is nan, e.g. slack bus
-        pm["gen"][str(idx)]["fluctuating"] = (not (math.isnan(row)) and row) * 1
+    # determine slack and fluctuating generators for all generators at once and
+    # convert boolean to 0 and 1 (fluctuating is nan e.g. for slack bus)
+    gen_slack = (psa_net.generators["control"] == "Slack").astype(int).tolist()
+    fluctuating = (
+        psa_net.generators["fluctuating"]
+        .fillna(False)
+        .astype(bool)
+        .astype(int)
+        .tolist()
+    )
+    for idx, (gen_slack_idx, fluctuating_idx) in enumerate(
+        zip(gen_slack, fluctuating), start=1
+    ):
+        gen = pm["gen"][str(idx)]
+        gen["gen_slack"] = gen_slack_idx
+        gen["fluctuating"] = fluctuating_idx
 
     if len(ppc["gencost"]) > len(ppc["gen"]):
         ppc["gencost"] = ppc["gencost"][: ppc["gen"].shape[0], :]
@@ -326,6 +378,24 @@ def _init_ppc():
     return ppc
 
 
+def _get_bus_indices(psa_net, bus_names):
+    """
+    Get positional indices of buses in psa_net.buses, looked up all at once
+
+    :param psa_net: pypsa network
+    :param bus_names: names of buses to get indices for
+    :return: bus_indices: numpy.ndarray
+    """
+    bus_indices = psa_net.buses.index.get_indexer(bus_names)
+    if (bus_indices < 0).any():
+        raise KeyError(
+            "Buses {} are not in pypsa network.".format(
+                list(np.asarray(bus_names)[bus_indices < 0])
+            )
+        )
+    return bus_indices
+
+
 def _build_bus(psa_net, ppc):
     n_bus = len(psa_net.buses.index)
     print("build {} buses".format(n_bus))
@@ -349,21 +419,27 @@ def _build_bus(psa_net, ppc):
     ppc["bus"][:, :bus_cols] = np.array([0, 1, 0, 0, 0, 0, 1, 1, 0, 0, 1, 1.05, 0.95])
     ppc["bus"][:, BUS_I] = np.arange(n_bus)  # noqa: F405
     bus_types = ["PQ", "PV", "Slack", "None"]
-    bus_types_int = np.array(
-        [bus_types.index(b_type) + 1 for b_type in psa_net.buses["control"].values],
-        dtype=int,
-    )
+    bus_types_codes = pd.Categorical(
+        psa_net.buses["control"], categories=bus_types
+    ).codes
+    if (bus_types_codes < 0).any():
+        raise ValueError(
+            "Bus types {} are not valid.".format(
+                set(psa_net.buses["control"].values[bus_types_codes < 0])
+            )
+        )
+    bus_types_int = bus_types_codes.astype(int) + 1
     ppc["bus"][:, BUS_TYPE] = bus_types_int  # noqa: F405
     ppc["bus"][:, BASE_KV] = psa_net.buses["v_nom"].values  # noqa: F405
     # for edisgo scenario voltage bounds defined for load and feed-in case with
     # 0.985<= v <= 1.05 bounds have to be at least in that range, only accept stronger
     # bounds if given
-    ppc["bus"][:, VMAX] = [  # noqa: F405
-        min(val, 1.05) for val in psa_net.buses["v_mag_pu_max"].values
-    ]
-    ppc["bus"][:, VMIN] = [  # noqa: F405
-        max(val, 0.985) for val in psa_net.buses["v_mag_pu_min"].values
-    ]
+    ppc["bus"][:, VMAX] = np.minimum(  # noqa: F405
+        psa_net.buses["v_mag_pu_max"].to_numpy(), 1.05
+    )
+    ppc["bus"][:, VMIN] = np.maximum(  # noqa: F405
+        psa_net.buses["v_mag_pu_min"].to_numpy(), 0.985
+    )
     return
 
 
@@ -374,12 +450,7 @@ def _build_gen(psa_net, ppc):
     # Pc2, Qc1min, Qc1max, Qc2min, Qc2max, ramp_agc, ramp_10, ramp_30, ramp_q, apf
     ppc["gen"] = np.zeros(shape=(n_gen, gen_cols), dtype=float)
     # get bus indices for generators
-    bus_indices = np.array(
-        [
-            psa_net.buses.index.get_loc(bus_name)
-            for bus_name in psa_net.generators["bus"]
-        ]
-    )
+    bus_indices = _get_bus_indices(psa_net, psa_net.generators["bus"])
     print(
         "build {} generators, distributed on {} buses".format(
             n_gen, len(np.unique(bus_indices))
@@ -453,12 +524,8 @@ def _build_branch(psa_net, ppc):
 
     branch_cols = len(col_names)
     ppc["branch"] = np.zeros(shape=(n_branch, branch_cols), dtype=float)
-    from_bus = np.array(
-        [psa_net.buses.index.get_loc(bus_name) for bus_name in psa_net.lines["bus0"]]
-    )
-    to_bus = np.array(
-        [psa_net.buses.index.get_loc(bus_name) for bus_name in psa_net.lines["bus1"]]
-    )
+    from_bus = _get_bus_indices(psa_net, psa_net.lines["bus0"])
+    to_bus = _get_bus_indices(psa_net, psa_net.lines["bus1"])
     ppc["branch"][:, F_BUS] = from_bus  # noqa: F405
     ppc["branch"][:, T_BUS] = to_bus  # noqa: F405
 
@@ -520,18 +587,8 @@ def _build_transformers(psa_net, ppc):
     ]
 
     transformers = np.zeros(shape=(n_transformers, len(col_names)), dtype=float)
-    from_bus = np.array(
-        [
-            psa_net.buses.index.get_loc(bus_name)
-            for bus_name in psa_net.transformers["bus0"]
-        ]
-    )
-    to_bus = np.array(
-        [
-            psa_net.buses.index.get_loc(bus_name)
-            for bus_name in psa_net.transformers["bus1"]
-        ]
-    )
+    from_bus = _get_bus_indices(psa_net, psa_net.transformers["bus0"])
+    to_bus = _get_bus_indices(psa_net, psa_net.transformers["bus1"])
     transformers[:, F_BUS] = from_bus  # noqa: F405
     transformers[:, T_BUS] = to_bus  # noqa: F405
 
@@ -565,9 +622,7 @@ def _build_transformers(psa_net, ppc):
 
 def _build_load(psa_net, ppc):
     n_load = psa_net.loads.shape[0]
-    load_buses = np.array(
-        [psa_net.buses.index.get_loc(bus_name) for bus_name in psa_net.loads["bus"]]
-    )
+    load_buses = _get_bus_indices(psa_net, psa_net.loads["bus"])
     print(
         "build {} loads, distributed on {} buses".format(
             n_load, len(np.unique(load_buses))
@@ -580,19 +635,15 @@ def _build_load(psa_net, ppc):
     # istime = False
     # print("network has timeseries for load: {}".format(istime))
 
-    for (load_idx, bus_idx) in enumerate(load_buses):
-        # if istime:
-        #     # if timeseries take maximal value of load_bus for static information of
-        #     # the network
-        #     p_d = max(psa_net.loads_t["p_set"].values[:,load_idx])
-        #     q_d = max(psa_net.loads_t["q_set"].values[:,load_idx])
-        # else:
-        p_d = psa_net.loads["p_set"].values[load_idx]
-        q_d = psa_net.loads["q_set"].values[load_idx]
-        # increase demand at bus_idx by p_d and q_d from load_idx, as multiple loads
-        # can be attached to single bus
-        ppc["bus"][bus_idx, PD] += p_d  # noqa: F405
-        ppc["bus"][bus_idx, QD] += q_d  # noqa: F405
+    # increase demand at each bus by p_set and q_set of all loads attached to it,
+    # as multiple loads can be attached to single bus (np.add.at accumulates
+    # repeated bus indices)
+    np.add.at(
+        ppc["bus"][:, PD], load_buses, psa_net.loads["p_set"].to_numpy()  # noqa: F405
+    )
+    np.add.at(
+        ppc["bus"][:, QD], load_buses, psa_net.loads["q_set"].to_numpy()  # noqa: F405
+    )
 
     return
 
@@ -609,26 +660,30 @@ def _build_load_dict(psa_net, ppc):
     :return: load_dict: Dict()
     """
     load_dict = {"load_data": dict()}
-    load_buses = np.array(
-        [psa_net.buses.index.get_loc(bus_name) for bus_name in psa_net.loads["bus"]]
-    )
     time_horizon = len(psa_net.loads_t["p_set"])
 
     load_dict["time_horizon"] = time_horizon
-    for t in range(time_horizon):
-        load_dict["load_data"][str(t + 1)] = dict()
-        for (load_idx, bus_idx) in enumerate(load_buses):
-            # p_d = psa_net.loads_t["p_set"].values[t,load_idx]
-            # qd = psa_net.loads_t["q_set"].values[t,load_idx]
-            p_d = psa_net.loads_t["p_set"][psa_net.loads.index[load_idx]][t]
-            qd = psa_net.loads_t["q_set"][psa_net.loads.index[load_idx]][t]
-            load_dict["load_data"][str(t + 1)][str(load_idx + 1)] = {
-                "pd": p_d,
-                "qd": qd,
-                "load_bus": int(bus_idx + 1),
-                "status": True,
-                "index": int(load_idx + 1),
+    if time_horizon > 0:
+        # extract time series of all loads once, in the order of psa_net.loads,
+        # and convert them to nested lists with one list per time step
+        p_set = psa_net.loads_t["p_set"][psa_net.loads.index].to_numpy().tolist()
+        q_set = psa_net.loads_t["q_set"][psa_net.loads.index].to_numpy().tolist()
+        load_buses = (_get_bus_indices(psa_net, psa_net.loads["bus"]) + 1).tolist()
+        load_dict["load_data"] = {
+            str(t + 1): {
+                str(load_idx + 1): {
+                    "pd": p_d,
+                    "qd": q_d,
+                    "load_bus": bus_idx,
+                    "status": True,
+                    "index": load_idx + 1,
+                }
+                for load_idx, (bus_idx, p_d, q_d) in enumerate(
+                    zip(load_buses, p_set_t, q_set_t)
+                )
             }
+            for t, (p_set_t, q_set_t) in enumerate(zip(p_set, q_set))
+        }
 
     return load_dict
 
@@ -637,32 +692,34 @@ def _build_generator_dict(psa_net, ppc):
     generator_dict = {"gen_data": dict()}
     time_horizon = len(psa_net.generators_t["p_set"])
     generator_dict["time_horizon"] = time_horizon
-    # buses_with_gens = [psa_net.generators.loc[busname]["bus"] for busname in
-    # psa_net.generators_t["p_set"].columns]
-    # gen_buses = np.array([psa_net.buses.index.get_loc(bus_name) for bus_name in
-    # buses_with_gens])
-    gen_buses = [
-        psa_net.buses.index.get_loc(bus_name) for bus_name in psa_net.generators["bus"]
-    ]
-    for t in range(time_horizon):
-        generator_dict["gen_data"][str(t + 1)] = dict()
-        for (gen_idx, bus_idx) in enumerate(gen_buses):
-            # pg = psa_net.generators_t["p_set"].values[t, gen_idx]
-            # qg = psa_net.generators_t["q_set"].values[t, gen_idx]
-            pg = psa_net.generators_t["p_set"][psa_net.generators.index[gen_idx]][t]
-            qg = psa_net.generators_t["q_set"][psa_net.generators.index[gen_idx]][t]
-            # if no value is set, set pg and qg to large value, e.g. representing slack
-            # TODO verify or find another solution not using "large" value
-            if np.isnan(pg):
-                pg = 99999
-            if np.isnan(qg):
-                qg = 99999
-            generator_dict["gen_data"][str(t + 1)][str(gen_idx + 1)] = {
-                "pg": pg,
-                "qg": qg,
-                "gen_bus": int(bus_idx) + 1,
-                "status": True,
-                "index": int(gen_idx + 1),
+    if time_horizon > 0:
+        # extract time series of all generators once, in the order of
+        # psa_net.generators, and convert them to nested lists with one list per
+        # time step
+        p_set = (
+            psa_net.generators_t["p_set"][psa_net.generators.index].to_numpy().tolist()
+        )
+        q_set = (
+            psa_net.generators_t["q_set"][psa_net.generators.index].to_numpy().tolist()
+        )
+        # bus indices of generators were already determined in _build_gen
+        gen_buses = (ppc["gen"][:, GEN_BUS].astype(int) + 1).tolist()  # noqa: F405
+        # if no value is set, set pg and qg to large value, e.g. representing slack
+        # TODO verify or find another solution not using "large" value
+        generator_dict["gen_data"] = {
+            str(t + 1): {
+                str(gen_idx + 1): {
+                    "pg": 99999 if math.isnan(pg) else pg,
+                    "qg": 99999 if math.isnan(qg) else qg,
+                    "gen_bus": bus_idx,
+                    "status": True,
+                    "index": gen_idx + 1,
+                }
+                for gen_idx, (bus_idx, pg, qg) in enumerate(
+                    zip(gen_buses, p_set_t, q_set_t)
+                )
             }
+            for t, (p_set_t, q_set_t) in enumerate(zip(p_set, q_set))
+        }
 
     return generator_dict
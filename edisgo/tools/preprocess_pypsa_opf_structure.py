@@ -142,10 +142,10 @@ def aggregate_fluct_generators(psa_network):
     """
     gen_df = psa_network.generators.copy()
     gen_t_dict = psa_network.generators_t.copy()
-    gen_buses = np.unique(gen_df.bus)
     gen_aggr_df_all = pd.DataFrame(columns=gen_df.columns)
-    for gen_bus in gen_buses:
-        gens = gen_df[gen_df.bus == gen_bus]
+    # group generators by bus once instead of selecting generators of each bus
+    # through a boolean mask over all generators
+    for gen_bus, gens in psa_network.generators.groupby("bus"):
         n_gens = len(gens)
         if n_gens <= 1:
             # no generators to aggregate at this bus
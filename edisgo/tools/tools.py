@@ -102,8 +102,12 @@ def calculate_relative_line_load(edisgo_obj, lines=None, timesteps=None):
 
     mv_lines_allowed_load = check_tech_constraints.lines_allowed_load(edisgo_obj, "mv")
     lv_lines_allowed_load = check_tech_constraints.lines_allowed_load(edisgo_obj, "lv")
-    lines_allowed_load = pd.concat(
-        [mv_lines_allowed_load, lv_lines_allowed_load], axis=1, sort=False
+    # allowed line load of both voltage levels is determined for the same time
+    # steps, wherefore underlying arrays can be stacked without aligning the index
+    lines_allowed_load = pd.DataFrame(
+        np.hstack([mv_lines_allowed_load.to_numpy(), lv_lines_allowed_load.to_numpy()]),
+        index=mv_lines_allowed_load.index,
+        columns=mv_lines_allowed_load.columns.append(lv_lines_allowed_load.columns),
     ).loc[timesteps, line_indices]
 
     return check_tech_constraints.lines_relative_load(edisgo_obj, lines_allowed_load)
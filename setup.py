@@ -27,7 +27,8 @@ def read(fname):
         File content
 
     """
-    return open(os.path.join(os.path.dirname(__file__), fname)).read()
+    with open(os.path.join(os.path.dirname(__file__), fname), encoding="utf-8") as f:
+        return f.read()
 
 
 requirements = [
@@ -48,13 +49,8 @@ requirements = [
     "matplotlib >= 3.3.0",
     "pypower",
     "scikit-learn",
-    "pydot",
     "pygeos",
     "beautifulsoup4",
-    "contextily",
-    "descartes",
-    "jupyter",
-    "jupyterlab",
     "plotly",
     "dash==2.6.0",
     "jupyter_dash",
@@ -74,7 +70,26 @@ dev_requirements = [
     "pylint",
 ]
 
-extras = {"dev": dev_requirements}
+# optional dependencies only needed for background maps in plots and graphviz
+# layouts of grids
+plot_requirements = [
+    "contextily",
+    "descartes",
+    "pydot",
+]
+
+# optional dependencies needed to run the example notebooks
+notebook_requirements = [
+    "jupyter",
+    "jupyterlab",
+]
+
+extras = {
+    "dev": dev_requirements,
+    "plot": plot_requirements,
+    "notebook": notebook_requirements,
+    "full": dev_requirements + plot_requirements + notebook_requirements,
+}
 
 setup(
     name="eDisGo",
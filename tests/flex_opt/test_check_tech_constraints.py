@@ -4,6 +4,8 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from pandas.testing import assert_frame_equal
+
 from edisgo import EDisGo
 from edisgo.flex_opt import check_tech_constraints
 
@@ -84,6 +86,26 @@ class TestCheckTechConstraints:
         )
         assert df.at["LVGrid_1", "time_index"] == self.timesteps[0]
 
+    def test_n_jobs_lv_grids(self):
+
+        crit_stations = check_tech_constraints.mv_lv_station_load(self.edisgo)
+        voltage_issues = check_tech_constraints.lv_voltage_deviation(
+            self.edisgo, voltage_levels="lv", mode="stations"
+        )
+
+        # check that results are the same when LV grids are checked in parallel
+        self.edisgo.config["grid_expansion_parallelization"]["n_jobs_lv_grids"] = 2
+        assert_frame_equal(
+            crit_stations, check_tech_constraints.mv_lv_station_load(self.edisgo)
+        )
+        voltage_issues_parallel = check_tech_constraints.lv_voltage_deviation(
+            self.edisgo, voltage_levels="lv", mode="stations"
+        )
+        assert voltage_issues.keys() == voltage_issues_parallel.keys()
+        for grid in voltage_issues.keys():
+            assert_frame_equal(voltage_issues[grid], voltage_issues_parallel[grid])
+        self.edisgo.config["grid_expansion_parallelization"]["n_jobs_lv_grids"] = 1
+
     def test_lines_allowed_load(self):
 
         # check for MV
@@ -120,6 +142,45 @@ class TestCheckTechConstraints:
             0.08521689973238901 / 0.4 / sqrt(3),
         )
 
+    def test_clear_load_feedin_case_cache(self):
+
+        df = check_tech_constraints.lines_allowed_load(self.edisgo, "mv")
+        assert self.edisgo in check_tech_constraints._load_feedin_case_cache
+
+        # check that allowed load reflects topology changes without clearing the
+        # cache
+        s_nom = self.edisgo.topology.lines_df.at["Line_10005", "s_nom"]
+        self.edisgo.topology._lines_df.at["Line_10005", "s_nom"] = 2 * s_nom
+        df_new = check_tech_constraints.lines_allowed_load(self.edisgo, "mv")
+        assert np.isclose(
+            df_new.at[self.timesteps[2], "Line_10005"],
+            2 * df.at[self.timesteps[2], "Line_10005"],
+        )
+        self.edisgo.topology._lines_df.at["Line_10005", "s_nom"] = s_nom
+
+        # check that cache of given EDisGo object is cleared
+        check_tech_constraints.clear_load_feedin_case_cache(self.edisgo)
+        assert self.edisgo not in check_tech_constraints._load_feedin_case_cache
+
+    def test_lines_relative_load(self):
+
+        i_lines_allowed = check_tech_constraints.lines_allowed_load(self.edisgo, "mv")
+        df = check_tech_constraints.lines_relative_load(self.edisgo, i_lines_allowed)
+        assert (4, 30) == df.shape
+        assert np.isclose(
+            df.at[self.timesteps[0], "Line_10005"],
+            self.edisgo.results.i_res.at[self.timesteps[0], "Line_10005"]
+            / (7.274613391789284 / 20 / sqrt(3) * 0.5),
+        )
+
+        # check that precision of reduced power flow results is kept
+        self.edisgo.results.reduce_memory(attr_to_reduce=["i_res"])
+        df_reduced = check_tech_constraints.lines_relative_load(
+            self.edisgo, i_lines_allowed
+        )
+        assert (df_reduced.dtypes == "float32").all()
+        assert np.allclose(df_reduced, df, rtol=1e-5)
+
     def mv_voltage_issues(self):
         """
         Fixture to create voltage issues in MV grid.
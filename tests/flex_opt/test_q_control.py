@@ -1,11 +1,20 @@
 import numpy as np
 import pandas as pd
+import pytest
 
 from edisgo.flex_opt import q_control
 from edisgo.tools.config import Config
 
 
 class TestQControl:
+    @classmethod
+    def setup_class(cls):
+        cls.config = Config()
+        cls.comp_df = pd.DataFrame(
+            data={"voltage_level": ["mv", "lv", "lv"]},
+            index=["comp_mv_1", "comp_lv_1", "comp_lv_2"],
+        )
+
     def test_get_q_sign_generator(self):
         assert q_control.get_q_sign_generator("Inductive") == -1
         assert q_control.get_q_sign_generator("capacitive") == 1
@@ -34,6 +43,8 @@ class TestQControl:
             [0.9, 0.95, 1.0, 0.9],
             index=["comp_mv_1", "comp_mv_2", "comp_lv_1", "comp_lv_2"],
         )
+        # active power values to derive expected reactive power from
+        active_power = active_power_ts.values
 
         # test with q_sign as Series and power_factor as float
         reactive_power_ts = q_control.fixed_cosphi(
@@ -44,12 +55,8 @@ class TestQControl:
 
         assert reactive_power_ts.shape == (2, 4)
         assert np.isclose(
-            reactive_power_ts.loc[:, ["comp_mv_1", "comp_lv_2"]].values,
-            active_power_ts.loc[:, ["comp_mv_1", "comp_lv_2"]].values * -0.484322,
-        ).all()
-        assert np.isclose(
-            reactive_power_ts.loc[:, "comp_lv_1"].values,
-            active_power_ts.loc[:, "comp_lv_1"].values * 0.484322,
+            reactive_power_ts[active_power_ts.columns].values,
+            active_power * np.array([-0.484322, 0.484322, 0.484322, -0.484322]),
         ).all()
 
         # test with q_sign as int and power_factor as Series
@@ -61,16 +68,8 @@ class TestQControl:
 
         assert reactive_power_ts.shape == (2, 4)
         assert np.isclose(
-            reactive_power_ts.loc[:, ["comp_mv_1", "comp_lv_2"]].values,
-            active_power_ts.loc[:, ["comp_mv_1", "comp_lv_2"]].values * 0.484322,
-        ).all()
-        assert np.isclose(
-            reactive_power_ts.loc[:, "comp_lv_1"].values,
-            [0.0, 0.0],
-        ).all()
-        assert np.isclose(
-            reactive_power_ts.loc[:, "comp_mv_2"].values,
-            active_power_ts.loc[:, "comp_mv_2"].values * 0.328684,
+            reactive_power_ts[active_power_ts.columns].values,
+            active_power * np.array([0.484322, 0.328684, 0.0, 0.484322]),
         ).all()
 
         # test with q_sign as int and power_factor as float
@@ -82,140 +81,48 @@ class TestQControl:
 
         assert reactive_power_ts.shape == (2, 4)
         assert np.isclose(
-            reactive_power_ts.loc[
-                :, ["comp_mv_1", "comp_mv_2", "comp_lv_1", "comp_lv_2"]
-            ].values,
-            active_power_ts.loc[
-                :, ["comp_mv_1", "comp_mv_2", "comp_lv_1", "comp_lv_2"]
-            ].values
-            * 0.328684,
-        ).all()
-
-    def test__fixed_cosphi_default_power_factor(
-        self,
-    ):
-        df = pd.DataFrame(
-            data={"voltage_level": ["mv", "lv", "lv"]},
-            index=["comp_mv_1", "comp_lv_1", "comp_lv_2"],
-        )
-        config = Config()
-
-        # test for component_type="generators"
-        pf = q_control._fixed_cosphi_default_power_factor(
-            comp_df=df, component_type="generators", configs=config
-        )
-
-        assert pf.shape == (3,)
-        assert np.isclose(
-            pf.loc[["comp_mv_1", "comp_lv_1", "comp_lv_2"]].values,
-            [0.9, 0.95, 0.95],
-        ).all()
-
-        # test for component_type="loads"
+            reactive_power_ts[active_power_ts.columns].values,
+            active_power * 0.328684,
+        ).all()
+
+    @pytest.mark.parametrize(
+        "component_type, expected",
+        [
+            ("generators", [0.9, 0.95, 0.95]),
+            ("loads", [0.9, 0.95, 0.95]),
+            ("charging_points", [1.0, 1.0, 1.0]),
+            ("heat_pumps", [1.0, 1.0, 1.0]),
+            ("storage_units", [0.9, 0.95, 0.95]),
+        ],
+    )
+    def test__fixed_cosphi_default_power_factor(self, component_type, expected):
         pf = q_control._fixed_cosphi_default_power_factor(
-            comp_df=df, component_type="loads", configs=config
+            comp_df=self.comp_df, component_type=component_type, configs=self.config
         )
 
         assert pf.shape == (3,)
         assert np.isclose(
             pf.loc[["comp_mv_1", "comp_lv_1", "comp_lv_2"]].values,
-            [0.9, 0.95, 0.95],
+            expected,
         ).all()
 
-        # test for component_type="charging_points"
-        pf = q_control._fixed_cosphi_default_power_factor(
-            comp_df=df, component_type="charging_points", configs=config
+    @pytest.mark.parametrize(
+        "component_type, expected",
+        [
+            ("generators", [-1.0, -1.0, -1.0]),
+            ("loads", [1.0, 1.0, 1.0]),
+            ("charging_points", [1.0, 1.0, 1.0]),
+            ("heat_pumps", [1.0, 1.0, 1.0]),
+            ("storage_units", [-1.0, -1.0, -1.0]),
+        ],
+    )
+    def test__fixed_cosphi_default_reactive_power_sign(self, component_type, expected):
+        q_sign = q_control._fixed_cosphi_default_reactive_power_sign(
+            comp_df=self.comp_df, component_type=component_type, configs=self.config
         )
 
-        assert pf.shape == (3,)
-        assert np.isclose(
-            pf.loc[["comp_mv_1", "comp_lv_1", "comp_lv_2"]].values,
-            [1.0, 1.0, 1.0],
-        ).all()
-
-        # test for component_type="heat_pumps"
-        pf = q_control._fixed_cosphi_default_power_factor(
-            comp_df=df, component_type="heat_pumps", configs=config
-        )
-
-        assert pf.shape == (3,)
-        assert np.isclose(
-            pf.loc[["comp_mv_1", "comp_lv_1", "comp_lv_2"]].values,
-            [1.0, 1.0, 1.0],
-        ).all()
-
-        # test for component_type="storage_units"
-        pf = q_control._fixed_cosphi_default_power_factor(
-            comp_df=df, component_type="storage_units", configs=config
-        )
-
-        assert pf.shape == (3,)
+        assert q_sign.shape == (3,)
         assert np.isclose(
-            pf.loc[["comp_mv_1", "comp_lv_1", "comp_lv_2"]].values,
-            [0.9, 0.95, 0.95],
-        ).all()
-
-    def test__fixed_cosphi_default_reactive_power_sign(
-        self,
-    ):
-
-        df = pd.DataFrame(
-            data={"voltage_level": ["mv", "lv", "lv"]},
-            index=["comp_mv_1", "comp_lv_1", "comp_lv_2"],
-        )
-        config = Config()
-
-        # test for component_type="generators"
-        pf = q_control._fixed_cosphi_default_reactive_power_sign(
-            comp_df=df, component_type="generators", configs=config
-        )
-
-        assert pf.shape == (3,)
-        assert np.isclose(
-            pf.loc[["comp_mv_1", "comp_lv_1", "comp_lv_2"]].values,
-            [-1.0, -1.0, -1.0],
-        ).all()
-
-        # test for component_type="loads"
-        pf = q_control._fixed_cosphi_default_reactive_power_sign(
-            comp_df=df, component_type="loads", configs=config
-        )
-
-        assert pf.shape == (3,)
-        assert np.isclose(
-            pf.loc[["comp_mv_1", "comp_lv_1", "comp_lv_2"]].values,
-            [1.0, 1.0, 1.0],
-        ).all()
-
-        # test for component_type="charging_points"
-        pf = q_control._fixed_cosphi_default_reactive_power_sign(
-            comp_df=df, component_type="charging_points", configs=config
-        )
-
-        assert pf.shape == (3,)
-        assert np.isclose(
-            pf.loc[["comp_mv_1", "comp_lv_1", "comp_lv_2"]].values,
-            [1.0, 1.0, 1.0],
-        ).all()
-
-        # test for component_type="heat_pumps"
-        pf = q_control._fixed_cosphi_default_reactive_power_sign(
-            comp_df=df, component_type="heat_pumps", configs=config
-        )
-
-        assert pf.shape == (3,)
-        assert np.isclose(
-            pf.loc[["comp_mv_1", "comp_lv_1", "comp_lv_2"]].values,
-            [1.0, 1.0, 1.0],
-        ).all()
-
-        # test for component_type="storage_units"
-        pf = q_control._fixed_cosphi_default_reactive_power_sign(
-            comp_df=df, component_type="storage_units", configs=config
-        )
-
-        assert pf.shape == (3,)
-        assert np.isclose(
-            pf.loc[["comp_mv_1", "comp_lv_1", "comp_lv_2"]].values,
-            [-1.0, -1.0, -1.0],
+            q_sign.loc[["comp_mv_1", "comp_lv_1", "comp_lv_2"]].values,
+            expected,
         ).all()
@@ -1,7 +1,10 @@
+import copy
 import logging
 import os
 import shutil
 
+from types import SimpleNamespace
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -26,10 +29,16 @@ class TestTopology:
 
     """
 
+    @classmethod
+    def setup_class(cls):
+        # import ding0 grid only once and restore a copy of it for every test (grids
+        # reference the object holding the topology, wherefore the holder is copied)
+        cls.ding0_root = SimpleNamespace(topology=Topology())
+        ding0_import.import_ding0_grid(pytest.ding0_test_network_path, cls.ding0_root)
+
     @pytest.fixture(autouse=True)
     def setup_fixture(self):
-        self.topology = Topology()
-        ding0_import.import_ding0_grid(pytest.ding0_test_network_path, self)
+        self.topology = copy.deepcopy(self.ding0_root).topology
 
     def test_lv_grids(self):
         lv_grids = list(self.topology.lv_grids)